@@ -1,9 +1,22 @@
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 import os
-from groq import Groq
-import PyPDF2
-import docx
+import asyncio
+import shutil
+import re
+import hashlib
+from pathlib import PurePosixPath
+import orjson
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache, TTLCache
+import groq
+from groq import AsyncGroq
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+import fitz  # PyMuPDF
+from docx import Document
+from docx.text.paragraph import Paragraph
 import io
 from dotenv import load_dotenv
 
@@ -13,23 +26,33 @@ load_dotenv()
 app = FastAPI(
     title="Resume Analyzer API",
     description="AI-powered resume analysis using Groq",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
-ALLOWED_ORIGINS = [
-    "http://localhost:3000",
-    "http://localhost:3001",
-    "https://*.vercel.app",
+# Starlette matches allow_origins literally, so wildcard origins need a regex
+ALLOWED_ORIGIN_PATTERNS = [
+    r"http://localhost:(3000|3001)",
 ]
 
+# Vercel production and preview deployments of this project only, e.g.
+# https://<project>.vercel.app and https://<project>-git-<branch>-<team>.vercel.app
+if os.getenv("VERCEL_PROJECT"):
+    ALLOWED_ORIGIN_PATTERNS.append(
+        r"https://" + re.escape(os.getenv("VERCEL_PROJECT").lower()) + r"(-[a-z0-9-]+)?\.vercel\.app"
+    )
+
 # In production, you should set specific origins via environment variable
 if os.getenv("FRONTEND_URL"):
-    ALLOWED_ORIGINS.append(os.getenv("FRONTEND_URL"))
+    ALLOWED_ORIGIN_PATTERNS.append(re.escape(os.getenv("FRONTEND_URL")))
+
+ALLOWED_ORIGIN_REGEX = "^(" + "|".join(ALLOWED_ORIGIN_PATTERNS) + ")$"
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS if not os.getenv("ALLOW_ALL_ORIGINS") else ["*"],
+    allow_origins=["*"] if os.getenv("ALLOW_ALL_ORIGINS") else [],
+    allow_origin_regex=None if os.getenv("ALLOW_ALL_ORIGINS") else ALLOWED_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -40,30 +63,352 @@ def get_groq_client():
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise ValueError("GROQ_API_KEY environment variable is not set")
-    return Groq(api_key=api_key)
+    # Retries are handled by call_groq so backoff is applied in one place
+    return AsyncGroq(api_key=api_key, max_retries=0)
+
+@app.on_event("startup")
+async def create_groq_client():
+    """Create one Groq client per process so connections are reused across requests"""
+    app.state.groq = get_groq_client() if os.getenv("GROQ_API_KEY") else None
+
+@app.on_event("shutdown")
+async def close_groq_client():
+    if app.state.groq is not None:
+        await app.state.groq.close()
+
+@app.on_event("shutdown")
+def shutdown_extract_pools():
+    EXTRACT_POOL.shutdown(wait=False, cancel_futures=True)
+    PDF_EXTRACT_POOL.shutdown(wait=False, cancel_futures=True)
+
+# Client-side cap on concurrent Groq calls to stay under the rate limit
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", 8))
+GROQ_SEMAPHORE = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+
+# Deterministic sampling makes repeated analyses reproducible (and cache-friendly)
+GROQ_DETERMINISTIC = os.getenv("GROQ_DETERMINISTIC", "").lower() in ("1", "true", "yes")
+
+# Transient Groq errors (rate limits, 5xx, connection failures and timeouts) are
+# retried with exponential backoff
+GROQ_RETRY_MAX_WAIT = 8
+_groq_backoff = wait_exponential_jitter(initial=0.5, max=GROQ_RETRY_MAX_WAIT)
+
+def _wait_for_groq_retry(retry_state) -> float:
+    """Honor the Retry-After header when Groq sends one, otherwise back off exponentially"""
+    exc = retry_state.outcome.exception()
+    response = getattr(exc, "response", None)
+    if response is not None:
+        try:
+            return min(float(response.headers.get("retry-after")), GROQ_RETRY_MAX_WAIT)
+        except (TypeError, ValueError):
+            pass
+    return _groq_backoff(retry_state)
+
+@retry(
+    stop=stop_after_attempt(4),
+    wait=_wait_for_groq_retry,
+    retry=retry_if_exception_type(
+        (groq.RateLimitError, groq.InternalServerError, groq.APIConnectionError)
+    ),
+    reraise=True,
+)
+async def call_groq(client: AsyncGroq, messages: list, **kwargs):
+    return await client.chat.completions.create(
+        messages=messages,
+        model="llama-3.3-70b-versatile",
+        temperature=0 if GROQ_DETERMINISTIC else 0.7,
+        max_tokens=2000,
+        top_p=1,
+        **kwargs,
+    )
+
+# Completed analyses keyed by (resume text, job description) to skip repeat Groq calls
+ANALYSIS_CACHE = TTLCache(maxsize=1024, ttl=3600)
+ANALYSIS_CACHE_LOCK = asyncio.Lock()
+
+def analysis_cache_key(resume_text: str, job_description: str) -> str:
+    return hashlib.sha256((resume_text + "\x1f" + job_description).encode()).hexdigest()
+
+# Analysis prompts, built once at import time. The invariant instructions are sent
+# ahead of the per-request resume/job description so providers can cache the prefix.
+SYSTEM_PROMPT = "You are an expert resume reviewer and career coach with 10+ years of experience in recruitment and ATS optimization."
+
+ANALYSIS_INSTRUCTIONS = """You are an expert ATS (Applicant Tracking System) and career coach. Analyze the resume against the job description in the next message and provide detailed, actionable feedback.
+
+Provide a comprehensive analysis with these sections:
+
+1. MATCH SCORE
+   - Give a percentage (0-100%) rating
+   - Brief explanation of the score
+
+2. KEY STRENGTHS (3-5 points)
+   - Skills and experiences that align well
+   - Specific examples from the resume
+
+3. GAPS & MISSING SKILLS (3-5 points)
+   - Required qualifications not present
+   - Skills mentioned in job description but missing from resume
+
+4. ACTIONABLE RECOMMENDATIONS (3-5 points)
+   - Specific changes to improve the resume
+   - How to better highlight relevant experience
+   - Suggestions for formatting or content
+
+5. KEYWORDS TO ADD
+   - 5-8 important keywords from the job description
+   - Where to incorporate them in the resume
+
+Be specific, constructive, and professional. Focus on actionable advice."""
+
+RESUME_TMPL = """RESUME:
+{resume}
+
+JOB DESCRIPTION:
+{jd}"""
+
+# Accepted upload types; octet-stream covers browsers that don't know the DOCX type
+ALLOWED_EXTS = frozenset({"pdf", "docx"})
+ALLOWED_CONTENT_TYPES = frozenset({
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/octet-stream",
+})
+
+# Upper bound on resumes accepted by /analyze-batch
+MAX_BATCH_FILES = 20
+
+# Largest resume accepted, matching the 10MB limit enforced by the frontend.
+# python-multipart has already spooled the whole upload by the time the handler
+# runs; the limit only bounds how much of it is loaded into memory.
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Native poppler pdftotext is used for large PDFs when it is installed
+PDFTOTEXT_PATH = shutil.which("pdftotext")
+PDFTOTEXT_MIN_BYTES = 200_000
+# Only the first pages are converted (the text is capped anyway), and a stuck process is killed
+PDFTOTEXT_MAX_PAGES = 10
+PDFTOTEXT_TIMEOUT = 15
+
+# Dedicated pools for blocking PDF/DOCX parsing so the event loop stays free.
+# PyMuPDF is not thread-safe, so PDF parsing is serialized on a single thread.
+EXTRACT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="extract")
+PDF_EXTRACT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="extract-pdf")
 
-def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from PDF file"""
+# Extracted text keyed by a fingerprint of the uploaded file, so re-uploads skip parsing
+EXTRACT_CACHE = LRUCache(maxsize=256)
+
+# Resume text sent to the model is capped; extractors stop a little past it
+RESUME_MAX_CHARS = 4000
+EXTRACT_MAX_CHARS = 5000
+
+def extract_text_from_pdf(file_content: bytes, max_chars: int = EXTRACT_MAX_CHARS) -> str:
+    """Extract text from PDF file, stopping once max_chars have been collected"""
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        text = ""
-        for page in pdf_reader.pages:
-            extracted = page.extract_text()
-            if extracted:
-                text += extracted + "\n"
-        return text.strip()
+        doc = fitz.open(stream=file_content, filetype="pdf")
+        try:
+            parts = []
+            total = 0
+            for page in doc:
+                extracted = page.get_text("text")
+                if extracted:
+                    parts.append(extracted)
+                    total += len(extracted)
+                if total >= max_chars:
+                    break
+        finally:
+            doc.close()
+        return "\n".join(parts)[:max_chars].strip()
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading PDF: {str(e)}")
 
-def extract_text_from_docx(file_content: bytes) -> str:
-    """Extract text from DOCX file"""
+async def extract_text_with_pdftotext(file_content: bytes, max_chars: int = EXTRACT_MAX_CHARS) -> str:
+    """Extract text from PDF file using the pdftotext binary, truncated to max_chars"""
+    proc = await asyncio.create_subprocess_exec(
+        PDFTOTEXT_PATH, "-q", "-l", str(PDFTOTEXT_MAX_PAGES), "-", "-",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
     try:
-        doc = docx.Document(io.BytesIO(file_content))
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text.strip()
+        stdout, _ = await asyncio.wait_for(proc.communicate(file_content), timeout=PDFTOTEXT_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise RuntimeError(f"pdftotext timed out after {PDFTOTEXT_TIMEOUT}s")
+    if proc.returncode != 0:
+        raise RuntimeError(f"pdftotext exited with code {proc.returncode}")
+    # Cut the raw bytes first (UTF-8 is at most 4 bytes per char) so large
+    # documents are never decoded in full
+    return stdout[:max_chars * 4].decode("utf-8", errors="replace")[:max_chars].strip()
+
+def extract_text_from_docx(file_content: bytes, max_chars: int = EXTRACT_MAX_CHARS) -> str:
+    """Extract text from DOCX file, stopping once max_chars have been collected"""
+    try:
+        doc = Document(io.BytesIO(file_content))
+        parts = []
+        total = 0
+        # Walk body blocks lazily so paragraphs past the cap are never wrapped
+        for block in doc.iter_inner_content():
+            if not isinstance(block, Paragraph):
+                continue
+            text = block.text
+            if text:
+                parts.append(text)
+                total += len(text)
+                if total >= max_chars:
+                    break
+        return "\n".join(parts)[:max_chars].strip()
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading DOCX: {str(e)}")
 
+async def extract_resume_text(file_content: bytes, file_extension: str) -> str:
+    """Extract resume text, capped at RESUME_MAX_CHARS, without blocking the event loop"""
+    cache_key = (hashlib.blake2b(file_content, digest_size=16).digest(), file_extension)
+    text = EXTRACT_CACHE.get(cache_key)
+    if text is None:
+        text = (await _extract_resume_text(file_content, file_extension))[:RESUME_MAX_CHARS]
+        EXTRACT_CACHE[cache_key] = text
+    return text
+
+async def _extract_resume_text(file_content: bytes, file_extension: str) -> str:
+    loop = asyncio.get_running_loop()
+    if file_extension == 'pdf':
+        if PDFTOTEXT_PATH and len(file_content) > PDFTOTEXT_MIN_BYTES:
+            try:
+                text = await extract_text_with_pdftotext(file_content)
+                if text:
+                    return text
+            except (OSError, RuntimeError):
+                pass
+        return await loop.run_in_executor(PDF_EXTRACT_POOL, extract_text_from_pdf, file_content)
+    return await loop.run_in_executor(EXTRACT_POOL, extract_text_from_docx, file_content)
+
+async def read_upload(upload: UploadFile) -> bytes:
+    """Read an already-received upload into memory, rejecting it past MAX_UPLOAD_BYTES"""
+    buf = bytearray()
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File is too large. Maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)}MB"
+            )
+    return bytes(buf)
+
+def get_upload_extension(upload: UploadFile) -> str:
+    """Return the upload's file extension, rejecting unsupported files before reading"""
+    if not upload.filename:
+        raise HTTPException(status_code=400, detail="No file uploaded")
+    
+    file_extension = PurePosixPath(upload.filename).suffix.lower().lstrip(".")
+    if file_extension not in ALLOWED_EXTS:
+        raise HTTPException(
+            status_code=400, 
+            detail="Unsupported file format. Please upload PDF or DOCX"
+        )
+    
+    # Parts sent without a Content-Type header are left to the extension check
+    if upload.content_type and upload.content_type not in ALLOWED_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported content type '{upload.content_type}'. Please upload a PDF or DOCX file"
+        )
+    return file_extension
+
+def validate_job_description(job_description: str) -> str:
+    """Reject short job descriptions and truncate long ones for API limits"""
+    if not job_description or len(job_description.strip()) < 50:
+        raise HTTPException(
+            status_code=400,
+            detail="Job description is too short. Please provide a detailed description."
+        )
+    return job_description[:2500]
+
+async def load_resume_text(upload: UploadFile, file_extension: str) -> str:
+    """Read an upload and extract its text, rejecting files with too little text"""
+    content = await read_upload(upload)
+    resume_text = await extract_resume_text(content, file_extension)
+    if not resume_text or len(resume_text.strip()) < 100:
+        raise HTTPException(
+            status_code=400,
+            detail="Could not extract sufficient text from resume. Please check your file."
+        )
+    return resume_text
+
+def build_messages(resume_text: str, job_description: str) -> list:
+    prompt = RESUME_TMPL.format_map({"resume": resume_text, "jd": job_description})
+    return [
+        {
+            "role": "system",
+            "content": SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": ANALYSIS_INSTRUCTIONS,
+        },
+        {
+            "role": "user",
+            "content": prompt,
+        }
+    ]
+
+def build_metadata(resume_text: str, filename: str, cached: bool) -> dict:
+    return {
+        "resume_length": len(resume_text),
+        "filename": filename,
+        "model_used": "llama-3.3-70b-versatile",
+        "service": "groq",
+        "cached": cached
+    }
+
+async def get_cached_analysis(cache_key: str) -> Optional[str]:
+    async with ANALYSIS_CACHE_LOCK:
+        return ANALYSIS_CACHE.get(cache_key)
+
+async def run_analysis(client: AsyncGroq, messages: list, cache_key: str) -> str:
+    """Call Groq for a full (non-streamed) analysis and cache the result"""
+    async with GROQ_SEMAPHORE:
+        chat_completion = await call_groq(client, messages)
+    
+    analysis = chat_completion.choices[0].message.content
+    
+    # Empty completions are not cached, otherwise they would be served as hits
+    if analysis:
+        async with ANALYSIS_CACHE_LOCK:
+            ANALYSIS_CACHE[cache_key] = analysis
+    return analysis
+
+def sse_event(payload: dict) -> str:
+    return f"data: {orjson.dumps(payload).decode()}\n\n"
+
+async def stream_analysis(client, messages: list, cache_key: str, analysis: Optional[str], metadata: dict):
+    """Yield the analysis as SSE content events followed by a final metadata event"""
+    if analysis is not None:
+        yield sse_event({"content": analysis})
+        yield sse_event({"done": True, "metadata": metadata})
+        return
+    
+    parts = []
+    try:
+        async with GROQ_SEMAPHORE:
+            completion_stream = await call_groq(client, messages, stream=True)
+            async for chunk in completion_stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    parts.append(content)
+                    yield sse_event({"content": content})
+    except Exception as e:
+        yield sse_event({"error": f"Analysis failed: {str(e)}"})
+        return
+    
+    if parts:
+        async with ANALYSIS_CACHE_LOCK:
+            ANALYSIS_CACHE[cache_key] = "".join(parts)
+    yield sse_event({"done": True, "metadata": metadata})
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -73,6 +418,7 @@ async def root():
         "status": "running",
         "endpoints": {
             "/analyze": "POST - Analyze resume against job description",
+            "/analyze-batch": "POST - Analyze several resumes against one job description",
             "/health": "GET - Health check and API status",
             "/docs": "API documentation"
         }
@@ -100,119 +446,53 @@ async def health_check():
 @app.post("/analyze")
 async def analyze_resume(
     resume: UploadFile = File(..., description="Resume file (PDF or DOCX)"),
-    job_description: str = Form(..., description="Job description text")
+    job_description: str = Form(..., description="Job description text"),
+    stream: bool = Form(False, description="Stream the analysis as server-sent events")
 ):
     """
     Analyze resume against job description using AI
     
     - **resume**: Upload PDF or DOCX file
     - **job_description**: Paste the job description text
+    - **stream**: Stream the analysis as server-sent events instead of one JSON response
     """
     
-    # Validate file type
-    if not resume.filename:
-        raise HTTPException(status_code=400, detail="No file uploaded")
-    
-    file_extension = resume.filename.lower().split('.')[-1]
-    if file_extension not in ['pdf', 'docx']:
-        raise HTTPException(
-            status_code=400, 
-            detail="Unsupported file format. Please upload PDF or DOCX"
-        )
-    
-    # Validate job description
-    if not job_description or len(job_description.strip()) < 50:
-        raise HTTPException(
-            status_code=400,
-            detail="Job description is too short. Please provide a detailed description."
-        )
+    # Validate file type and job description
+    file_extension = get_upload_extension(resume)
+    job_description = validate_job_description(job_description)
     
     try:
-        # Read file content
-        content = await resume.read()
+        # Read file content and extract text based on file type
+        resume_text = await load_resume_text(resume, file_extension)
         
-        # Extract text based on file type
-        if file_extension == 'pdf':
-            resume_text = extract_text_from_pdf(content)
-        else:  # docx
-            resume_text = extract_text_from_docx(content)
+        # Create analysis prompt
+        messages = build_messages(resume_text, job_description)
         
-        # Validate extracted text
-        if not resume_text or len(resume_text.strip()) < 100:
-            raise HTTPException(
-                status_code=400,
-                detail="Could not extract sufficient text from resume. Please check your file."
-            )
+        # Reuse a previous analysis of the same resume and job description
+        cache_key = analysis_cache_key(resume_text, job_description)
+        analysis = await get_cached_analysis(cache_key)
+        cached = analysis is not None
         
-        # Truncate for API limits
-        resume_text = resume_text[:4000]  # Limit resume text
-        job_description = job_description[:2500]  # Limit job description
+        client = app.state.groq
+        if not cached and client is None:
+            raise ValueError("GROQ_API_KEY environment variable is not set")
         
-        # Create analysis prompt
-        prompt = f"""You are an expert ATS (Applicant Tracking System) and career coach. Analyze this resume against the job description and provide detailed, actionable feedback.
-
-RESUME:
-{resume_text}
-
-JOB DESCRIPTION:
-{job_description}
-
-Provide a comprehensive analysis with these sections:
-
-1. MATCH SCORE
-   - Give a percentage (0-100%) rating
-   - Brief explanation of the score
-
-2. KEY STRENGTHS (3-5 points)
-   - Skills and experiences that align well
-   - Specific examples from the resume
-
-3. GAPS & MISSING SKILLS (3-5 points)
-   - Required qualifications not present
-   - Skills mentioned in job description but missing from resume
-
-4. ACTIONABLE RECOMMENDATIONS (3-5 points)
-   - Specific changes to improve the resume
-   - How to better highlight relevant experience
-   - Suggestions for formatting or content
-
-5. KEYWORDS TO ADD
-   - 5-8 important keywords from the job description
-   - Where to incorporate them in the resume
-
-Be specific, constructive, and professional. Focus on actionable advice."""
-
-        # Call Groq API
-        client = get_groq_client()
+        metadata = build_metadata(resume_text, resume.filename, cached)
         
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert resume reviewer and career coach with 10+ years of experience in recruitment and ATS optimization."
-                },
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.7,
-            max_tokens=2000,
-            top_p=1,
-        )
+        if stream:
+            return StreamingResponse(
+                stream_analysis(client, messages, cache_key, analysis, metadata),
+                media_type="text/event-stream",
+            )
         
-        analysis = chat_completion.choices[0].message.content
+        if not cached:
+            # Call Groq API
+            analysis = await run_analysis(client, messages, cache_key)
         
         return {
             "success": True,
             "analysis": analysis,
-            "metadata": {
-                "resume_length": len(resume_text),
-                "filename": resume.filename,
-                "model_used": "llama-3.3-70b-versatile",
-                "service": "groq"
-            }
+            "metadata": metadata
         }
         
     except HTTPException:
@@ -223,7 +503,77 @@ Be specific, constructive, and professional. Focus on actionable advice."""
             detail=f"Analysis failed: {str(e)}"
         )
 
+async def analyze_batch_item(client: Optional[AsyncGroq], resume: UploadFile, job_description: str) -> dict:
+    """Analyze one resume of a batch, reporting failures in the result instead of raising"""
+    try:
+        file_extension = get_upload_extension(resume)
+        resume_text = await load_resume_text(resume, file_extension)
+        
+        cache_key = analysis_cache_key(resume_text, job_description)
+        analysis = await get_cached_analysis(cache_key)
+        cached = analysis is not None
+        
+        if not cached:
+            if client is None:
+                raise ValueError("GROQ_API_KEY environment variable is not set")
+            analysis = await run_analysis(client, build_messages(resume_text, job_description), cache_key)
+        
+        return {
+            "success": True,
+            "analysis": analysis,
+            "metadata": build_metadata(resume_text, resume.filename, cached)
+        }
+    except HTTPException as e:
+        return {"success": False, "filename": resume.filename, "detail": e.detail}
+    except Exception as e:
+        return {"success": False, "filename": resume.filename, "detail": f"Analysis failed: {str(e)}"}
+
+@app.post("/analyze-batch")
+async def analyze_resume_batch(
+    resumes: List[UploadFile] = File(..., description="Resume files (PDF or DOCX)"),
+    job_description: str = Form(..., description="Job description text")
+):
+    """
+    Analyze several resumes against one job description using AI
+    
+    - **resumes**: Upload up to 20 PDF or DOCX files
+    - **job_description**: Paste the job description text
+    
+    Results are returned in the same order as the uploaded files.
+    """
+    
+    if len(resumes) > MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many files. Please upload at most {MAX_BATCH_FILES} resumes per batch."
+        )
+    job_description = validate_job_description(job_description)
+    
+    # Groq calls fan out concurrently, bounded by GROQ_SEMAPHORE
+    results = await asyncio.gather(
+        *[analyze_batch_item(app.state.groq, resume, job_description) for resume in resumes]
+    )
+    
+    return {
+        "success": all(result["success"] for result in results),
+        "results": results
+    }
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # Multiple workers require an import string instead of the app object. Each
+    # spawned worker then imports this file twice (as __mp_main__ and as main),
+    # duplicating module-level pools; for multi-worker deployments prefer
+    # `uvicorn main:app --workers N`.
+    # "auto" picks uvloop/httptools when installed (uvicorn[standard]) and falls
+    # back to asyncio/h11 otherwise, e.g. on Windows where uvloop is unavailable.
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=port,
+        loop="auto",
+        http="auto",
+        workers=workers,
+    )
\ No newline at end of file